@@ -92,9 +92,9 @@ static char * Render_xpm[] = {
         from PySide.QtCore import QT_TRANSLATE_NOOP
         from FreeCAD import Console
         from FreeCADGui import addIconPath, addPreferencePage
-        from Render import RENDER_COMMANDS, ICONDIR, PREFPAGE
+        from Render import add_commands, ICONDIR, PREFPAGE
 
-        commands = RENDER_COMMANDS
+        commands = add_commands()
         self.appendToolbar(QT_TRANSLATE_NOOP("Workbench", "Render"), commands)
         self.appendMenu(QT_TRANSLATE_NOOP("Workbench", "&Render"), commands)
         addIconPath(ICONDIR)
@@ -38,26 +38,23 @@ the necessary UI controls.
 # ===========================================================================
 
 
-import sys
 import os
 import re
 import itertools
+import functools
+import inspect
+import weakref
+from collections import OrderedDict
 from importlib import import_module
-from tempfile import mkstemp
+from tempfile import NamedTemporaryFile
 from types import SimpleNamespace
 from operator import attrgetter
 
+import numpy as np
 from PySide.QtGui import QAction, QIcon, QFileDialog
 from PySide.QtCore import QT_TRANSLATE_NOOP, QObject, SIGNAL
 import FreeCAD as App
 import FreeCADGui as Gui
-import Draft
-import Part
-import MeshPart
-try:
-    import ImageGui
-except ImportError:
-    pass
 try:
     from draftutils.translate import translate  # 0.19
 except ImportError:
@@ -78,11 +75,59 @@ WBDIR = os.path.dirname(__file__)  # Workbench root directory
 RDRDIR = os.path.join(WBDIR, "renderers")
 ICONDIR = os.path.join(WBDIR, "icons")
 PREFPAGE = os.path.join(WBDIR, "ui", "RenderSettings.ui")
-# Renderers list
-RENDERERS = [x.group(1)
-             for x in map(lambda x: re.match(r"^([A-Z].*)\.py$", x),
-                          os.listdir(RDRDIR))
-             if x]
+# Tree view icons
+_ICON_RENDERPROJECT = os.path.join(ICONDIR, "RenderProject.svg")
+_ICON_RENDER = os.path.join(ICONDIR, "Render.svg")
+_ICON_VIEWTREE = os.path.join(ICONDIR, "RenderViewTree.svg")
+# Renderers list (see get_renderers)
+_PY_RE = re.compile(r"^([A-Z].*)\.py$")
+# Template placeholders (camera and content)
+_TOKEN_RE = re.compile(r".*Raytracing(Camera|Content).*")
+# Material color parser ("(r, g, b[, a])" strings)
+_COLOR_RE = re.compile(r"\(\s*([-\d.eE+]+)\s*,"
+                       r"\s*([-\d.eE+]+)\s*,"
+                       r"\s*([-\d.eE+]+)")
+# Views visibility getter
+_VISIBLE = attrgetter("Source.ViewObject.Visibility")
+# Tessellation parameters
+_MESH_KWARGS = {"LinearDeflection": 0.1,
+                "AngularDeflection": 0.523599,
+                "Relative": False}
+# Tessellation cache (see _mesh_from_shape), bounded by its total number of
+# facets, as a proxy for memory footprint.
+# Limit: as entries are made per object (group children included), a scene
+# larger than the bound evicts its own first objects while being rendered,
+# and so gets no cache hit on next render. Raise the bound for such scenes.
+_MESH_CACHE = OrderedDict()
+_MESH_CACHE_MAXFACETS = 2000000
+_MESH_CACHE_FACETS = 0  # Running total of facets in cache
+
+
+# ===========================================================================
+#                               Module functions
+# ===========================================================================
+
+
+@functools.lru_cache(maxsize=None)
+def _params():
+    """Get (and cache) Render workbench parameters handle"""
+    return App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
+
+
+@functools.lru_cache(maxsize=None)
+def get_renderers():
+    """Get (and cache) the list of available renderers names
+
+    The renderers directory is scanned on first call only.
+    """
+    return [x.group(1) for x in map(_PY_RE.match, os.listdir(RDRDIR)) if x]
+
+
+@functools.lru_cache(maxsize=None)
+def _msg_not_renderable():
+    """Get (and cache) translated 'not renderable' warning message"""
+    return translate("Render",
+                     "Unable to create rendering view for object {}\n")
 
 
 # ===========================================================================
@@ -96,7 +141,7 @@ class Project:
     # Related FeaturePython object has to be stored in a class variable,
     # (not in an instance variable...), otherwise it causes trouble in
     # serialization...
-    _fpos = dict()
+    _fpos = weakref.WeakKeyDictionary()
 
     def __init__(self, obj):
         obj.Proxy = self
@@ -105,12 +150,12 @@ class Project:
     @property
     def fpo(self):
         """Underlying FeaturePython object getter"""
-        return self._fpos[id(self)]
+        return self._fpos[self]
 
     @fpo.setter
     def fpo(self, new_fpo):
         """Underlying FeaturePython object setter"""
-        self._fpos[id(self)] = new_fpo
+        self._fpos[self] = new_fpo
 
     def set_properties(self, obj):
         """Set underlying FeaturePython object's properties
@@ -120,8 +165,9 @@ class Project:
         obj: FeaturePython Object related to this project
         """
         self.fpo = obj
+        existing = set(obj.PropertiesList)
 
-        if "Renderer" not in obj.PropertiesList:
+        if "Renderer" not in existing:
             obj.addProperty(
                 "App::PropertyString",
                 "Renderer",
@@ -130,7 +176,7 @@ class Project:
                     "App::Property",
                     "The name of the raytracing engine to use"))
 
-        if "DelayedBuild" not in obj.PropertiesList:
+        if "DelayedBuild" not in existing:
             obj.addProperty(
                 "App::PropertyBool",
                 "DelayedBuild",
@@ -140,7 +186,7 @@ class Project:
                     "If true, the views will be updated on render only"))
             obj.DelayedBuild = True
 
-        if "Template" not in obj.PropertiesList:
+        if "Template" not in existing:
             obj.addProperty(
                 "App::PropertyFile",
                 "Template",
@@ -149,7 +195,7 @@ class Project:
                     "App::Property",
                     "The template to be used by this rendering"))
 
-        if "PageResult" not in obj.PropertiesList:
+        if "PageResult" not in existing:
             obj.addProperty(
                 "App::PropertyFileIncluded",
                 "PageResult",
@@ -158,10 +204,10 @@ class Project:
                     "App::Property",
                     "The result file to be sent to the renderer"))
 
-        if "Group" not in obj.PropertiesList:
+        if "Group" not in existing:
             obj.addExtension("App::GroupExtensionPython", self)
 
-        if "RenderWidth" not in obj.PropertiesList:
+        if "RenderWidth" not in existing:
             obj.addProperty(
                 "App::PropertyInteger",
                 "RenderWidth",
@@ -169,10 +215,9 @@ class Project:
                 QT_TRANSLATE_NOOP(
                     "App::Property",
                     "The width of the rendered image in pixels"))
-            parname = "User parameter:BaseApp/Preferences/Mod/Render"
-            obj.RenderWidth = App.ParamGet(parname).GetInt("RenderWidth", 800)
+            obj.RenderWidth = _params().GetInt("RenderWidth", 800)
 
-        if "RenderHeight" not in obj.PropertiesList:
+        if "RenderHeight" not in existing:
             obj.addProperty(
                 "App::PropertyInteger",
                 "RenderHeight",
@@ -180,10 +225,9 @@ class Project:
                 QT_TRANSLATE_NOOP(
                     "App::Property",
                     "The height of the rendered image in pixels"))
-            par = "User parameter:BaseApp/Preferences/Mod/Render"
-            obj.RenderHeight = App.ParamGet(par).GetInt("RenderHeight", 600)
+            obj.RenderHeight = _params().GetInt("RenderHeight", 600)
 
-        if "GroundPlane" not in obj.PropertiesList:
+        if "GroundPlane" not in existing:
             obj.addProperty(
                 "App::PropertyBool",
                 "GroundPlane",
@@ -194,7 +238,7 @@ class Project:
                     "scene"))
             obj.GroundPlane = False
 
-        if "OutputImage" not in obj.PropertiesList:
+        if "OutputImage" not in existing:
             obj.addProperty(
                 "App::PropertyFile",
                 "OutputImage",
@@ -203,7 +247,7 @@ class Project:
                     "App::Property",
                     "The image saved by this render"))
 
-        if "OpenAfterRender" not in obj.PropertiesList:
+        if "OpenAfterRender" not in existing:
             obj.addProperty(
                 "App::PropertyBool",
                 "OpenAfterRender",
@@ -268,8 +312,8 @@ class Project:
     def write_groundplane(self, renderer):
         """Generate a ground plane rendering string for the scene
 
-        For that purpose, dummy objects are temporarily added to the document
-        which the project belongs to, and eventually deleted
+        For that purpose, a dummy view is built in memory, wrapping a face
+        which is not added to the document (no recomputation needed)
 
         Parameters
         ----------
@@ -279,8 +323,9 @@ class Project:
         -------
         The rendering string for the ground plane
         """
+        import Part  # pylint: disable=import-outside-toplevel
+
         result = ""
-        doc = self.fpo.Document
         bbox = App.BoundBox()
         for view in self.fpo.Group:
             try:
@@ -288,7 +333,7 @@ class Project:
             except AttributeError:
                 pass
         if bbox.isValid():
-            # Create temporary object. We do this to keep renderers codes as
+            # Create dummy view. We do this to keep renderers codes as
             # simple as possible: they only need to deal with one type of
             # object: RenderView objects
             margin = bbox.DiagonalLength / 2
@@ -297,27 +342,35 @@ class Project:
                         App.Vector(bbox.XMax + margin, bbox.YMax + margin, 0),
                         App.Vector(bbox.XMin - margin, bbox.YMax + margin, 0)]
             vertices.append(vertices[0])  # Close the polyline...
-            dummy1 = doc.addObject("Part::Feature", "dummygroundplane1")
-            dummy1.Shape = Part.Face(Part.makePolygon(vertices))
-            dummy2 = doc.addObject("App::FeaturePython", "dummygroundplane2")
-            View(dummy2)
-            dummy2.Source = dummy1
-            ViewProviderView(dummy2.ViewObject)
-            doc.recompute()
-
-            result = renderer.get_rendering_string(dummy2)
-
-            # Remove temp objects
-            doc.removeObject(dummy2.Name)
-            doc.removeObject(dummy1.Name)
-            doc.recompute()
+            dummysrc = SimpleNamespace()
+            dummysrc.Shape = Part.Face(Part.makePolygon(vertices))
+            dummysrc.Name = "dummygroundplane"
+            dummysrc.Label = "dummygroundplane"
+            dummysrc.PropertiesList = []
+            # Default shape color, as a temporary Part::Feature would get
+            # (preference is packed as 0xRRGGBBAA)
+            rgba = App.ParamGet("User parameter:BaseApp/Preferences/View")\
+                .GetUnsigned("DefaultShapeColor", 0xCCCCCCFF)
+            color = tuple(((rgba >> shift) & 0xFF) / 255
+                          for shift in (24, 16, 8))
+            dummysrc.ViewObject = SimpleNamespace(ShapeColor=color,
+                                                  Transparency=0)
+            dummysrc.isDerivedFrom = lambda typeid: typeid == "Part::Feature"
+            dummyview = SimpleNamespace()
+            dummyview.Source = dummysrc
+            dummyview.Name = "dummygroundplaneView"
+            dummyview.Label = View.view_label(dummysrc, self.fpo)
+            dummyview.Material = None
+
+            result = renderer.get_rendering_string(dummyview)
 
         return result
 
     def add_objects(self, objs):
         """Add objects as new views to the project
 
-        This method can handle objects groups, recursively.
+        This method can handle objects groups, recursively. Objects reachable
+        through several groups are added only once.
 
         This function checks if each object is renderable before adding it,
         via 'RendererHandler.is_renderable'; if not, a warning is issued and
@@ -326,6 +379,7 @@ class Project:
         Parameters
         objs -- an iterable on FreeCAD objects to add to project
         """
+        seen = set()  # Objects already processed, by (document, name)
 
         def add_to_group(objs, group):
             """Add objects as views to a group
@@ -333,6 +387,10 @@ class Project:
             objs -- FreeCAD objects to add
             group -- The  group (App::DocumentObjectGroup) to add to"""
             for obj in objs:
+                key = (obj.Document.Name, obj.Name)
+                if key in seen:
+                    continue
+                seen.add(key)
                 if obj.isDerivedFrom("App::DocumentObjectGroup"):
                     assert obj != group  # Just in case...
                     label = View.view_label(obj, group)
@@ -344,28 +402,25 @@ class Project:
                 elif RendererHandler.is_renderable(obj):
                     View.create(obj, group)
                 else:
-                    msg = translate(
-                        "Render",
-                        "Unable to create rendering view for object {}\n")
+                    msg = _msg_not_renderable()
                     App.Console.PrintWarning(msg.format(obj.Label))
 
         # Here starts add_objects
         add_to_group(iter(objs), self.fpo)
 
     def all_views(self):
-        """Give the list of all views contained in the project"""
-        def all_group_objs(group):
-            """Returns all objects in group (recursively exploding
-            subgroups)
-            """
-            res = []
-            for obj in group.Group:
-                res.extend(
-                    [obj] if not obj.isDerivedFrom("App::DocumentObjectGroup")
-                    else all_group_objs(obj)
-                    )
-            return res
-        return all_group_objs(self.fpo)
+        """Iterate over all views contained in the project (recursively
+        exploding subgroups)
+        """
+        stack = [iter(self.fpo.Group)]
+        while stack:
+            for obj in stack[-1]:
+                if obj.isDerivedFrom("App::DocumentObjectGroup"):
+                    stack.append(iter(obj.Group))
+                    break
+                yield obj
+            else:
+                stack.pop()
 
     def render(self, external=True):
         """Render the project, calling external renderer
@@ -382,7 +437,7 @@ class Project:
 
         # Get a handle to renderer module
         try:
-            renderer = RendererHandler(obj.Renderer)
+            renderer = get_renderer_handler(obj.Renderer)
         except ModuleNotFoundError:
             msg = translate(
                 "Render", "Cannot render project: Renderer '%s' not found\n")
@@ -392,11 +447,8 @@ class Project:
         # Get the rendering template
         assert (obj.Template and os.path.exists(obj.Template)),\
             "Cannot render project: Template not found"
-        template = None
-        with open(obj.Template, "r") as template_file:
+        with open(obj.Template, "r", encoding="utf8") as template_file:
             template = template_file.read()
-        if sys.version_info.major < 3:
-            template = template.decode("utf8")
 
         # Build a default camera, to be used if no camera is present in the
         # scene
@@ -415,12 +467,11 @@ class Project:
         del defaultcamview, camstr
 
         # Get objects rendering strings (including lights, cameras...)
-        views = self.all_views()
         get_rdr_string =\
             renderer.get_rendering_string if obj.DelayedBuild\
             else attrgetter("ViewResult")
-        objstrings = [get_rdr_string(v) for v in views
-                      if v.Source.ViewObject.Visibility]
+        objstrings = list(map(get_rdr_string,
+                              filter(_VISIBLE, self.all_views())))
 
         # Add a ground plane if required
         if getattr(obj, "GroundPlane", False):
@@ -429,30 +480,33 @@ class Project:
         # Merge all strings (cam, objects, ground plane...) into rendering
         # template
         renderobjs = '\n'.join(objstrings)
-        if "RaytracingCamera" in template:
-            template = re.sub("(.*RaytracingCamera.*)", cam, template)
-            template = re.sub("(.*RaytracingContent.*)", renderobjs, template)
-        else:
-            template = re.sub("(.*RaytracingContent.*)",
-                              cam + "\n" + renderobjs, template)
-        template = (template.encode("utf8") if sys.version_info.major < 3
-                    else template)
+        if "RaytracingCamera" not in template:
+            renderobjs = cam + "\n" + renderobjs
+        subs = {"Camera": cam, "Content": renderobjs}
+        template = _TOKEN_RE.sub(lambda m: subs[m.group(1)], template)
 
         # Write instantiated template into a temporary file
-        fhandle, fpath = mkstemp(prefix=obj.Name,
-                                 suffix=os.path.splitext(obj.Template)[-1])
-        with open(fpath, "w") as fobj:
+        # (PageResult makes its own copy, so the file can be removed then)
+        with NamedTemporaryFile(mode="w",
+                                encoding="utf8",
+                                prefix=obj.Name,
+                                suffix=os.path.splitext(obj.Template)[-1],
+                                delete=False) as fobj:
             fobj.write(template)
-        os.close(fhandle)
-        obj.PageResult = fpath
-        os.remove(fpath)
+        obj.PageResult = fobj.name
+        os.remove(fobj.name)
         assert obj.PageResult, "Rendering error: No page result"
 
-        App.ActiveDocument.recompute()
+        # In delayed build mode, nothing depends on PageResult: no need to
+        # recompute, but the project, touched by PageResult assignment, must
+        # not be left marked for recompute
+        if not obj.DelayedBuild:
+            App.ActiveDocument.recompute()
+        else:
+            obj.purgeTouched()
 
         # Fetch the rendering parameters
-        params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
-        prefix = params.GetString("Prefix", "")
+        prefix = _params().GetString("Prefix", "")
         if prefix:
             prefix += " "
 
@@ -478,8 +532,9 @@ class Project:
         # Open result in GUI if relevant
         try:
             if img and obj.OpenAfterRender:
+                import ImageGui  # pylint: disable=import-outside-toplevel
                 ImageGui.open(img)
-        except (AttributeError, NameError):
+        except (AttributeError, ImportError):
             pass
 
         # And eventually return result path
@@ -489,6 +544,8 @@ class Project:
 class ViewProviderProject:
     """View provider for rendering project object"""
 
+    _render_qicon = None  # Context menu icon (created on first use)
+
     def __init__(self, vobj):
         vobj.Proxy = self
         self.object = vobj.Object
@@ -529,13 +586,14 @@ class ViewProviderProject:
 
     def getIcon(self):  # pylint: disable=no-self-use
         """Return the icon which will appear in the tree view (callback)."""
-        return os.path.join(WBDIR, "icons", "RenderProject.svg")
+        return _ICON_RENDERPROJECT
 
     def setupContextMenu(self, vobj, menu):  # pylint: disable=no-self-use
         """Setup the context menu associated to the object in tree view
         (callback)"""
-        icon = QIcon(os.path.join(WBDIR, "icons", "Render.svg"))
-        action1 = QAction(icon, "Render", menu)
+        if ViewProviderProject._render_qicon is None:
+            ViewProviderProject._render_qicon = QIcon(_ICON_RENDER)
+        action1 = QAction(ViewProviderProject._render_qicon, "Render", menu)
         QObject.connect(action1, SIGNAL("triggered()"), self.render)
         menu.addAction(action1)
 
@@ -592,7 +650,7 @@ class View:
             return
 
         # Get object rendering string and set ViewResult property
-        renderer = RendererHandler(proj.Renderer)
+        renderer = get_renderer_handler(proj.Renderer)
         obj.ViewResult = renderer.get_rendering_string(obj)
 
     @staticmethod
@@ -603,12 +661,7 @@ class View:
         proj -- project in which the view will be inserted
 
         Both obj and proj should have valid Label attribute"""
-        obj_label = str(obj.Label)
-        proj_label = str(proj.Label)
-
-        proj_label2 = proj_label.replace(" ", "")
-        res = "{o}@{p}".format(o=obj_label, p=proj_label2)
-        return res
+        return f"{obj.Label}@{proj.Label.replace(' ', '')}"
 
     @staticmethod
     def create(fcd_obj, project):
@@ -684,7 +737,7 @@ class ViewProviderView:
 
     def getIcon(self):  # pylint: disable=no-self-use
         """Return the icon which will appear in the tree view (callback)."""
-        return os.path.join(WBDIR, "icons", "RenderViewTree.svg")
+        return _ICON_VIEWTREE
 
 
 # ===========================================================================
@@ -692,6 +745,53 @@ class ViewProviderView:
 # ===========================================================================
 
 
+def _mesh_from_shape(key, shape):
+    """Tessellate a shape, reusing a previous tessellation when possible
+
+    Meshes are kept in a LRU cache, so that unchanged geometry is not
+    tessellated again on subsequent renders. Each entry keeps its shape
+    alongside the mesh: a cached mesh is reused only if the shape is still
+    the same (TopoShape.isEqual), and holding the shape prevents its
+    identity from being recycled by a new shape.
+
+    Parameters:
+    key: a hashable key identifying the object owning the shape, or None
+         not to use the cache (for transient shapes)
+    shape: the shape to tessellate
+
+    Returns: the mesh
+    """
+    global _MESH_CACHE_FACETS  # pylint: disable=global-statement
+
+    if key is not None:
+        try:
+            cached_shape, mesh, _ = _MESH_CACHE[key]
+        except KeyError:
+            pass
+        else:
+            if cached_shape.isEqual(shape):
+                _MESH_CACHE.move_to_end(key)
+                return mesh
+
+    import MeshPart  # pylint: disable=import-outside-toplevel
+    mesh = MeshPart.meshFromShape(Shape=shape, **_MESH_KWARGS)
+
+    if key is not None:
+        # Facets counts are stored in entries, so that the running total can
+        # be maintained without querying meshes again
+        facets = mesh.CountFacets
+        previous = _MESH_CACHE.pop(key, None)
+        if previous is not None:
+            _MESH_CACHE_FACETS -= previous[2]
+        _MESH_CACHE[key] = (shape, mesh, facets)
+        _MESH_CACHE_FACETS += facets
+        while (_MESH_CACHE_FACETS > _MESH_CACHE_MAXFACETS and
+               len(_MESH_CACHE) > 1):
+            _, (_, _, oldest) = _MESH_CACHE.popitem(last=False)
+            _MESH_CACHE_FACETS -= oldest
+    return mesh
+
+
 class RendererHandler:
     """This class provides simplified access to external renderers modules.
 
@@ -704,6 +804,9 @@ class RendererHandler:
       selecting the right method in renderer module according to
     view object's type.
     """
+
+    _RENDERABLE_PROXIES = frozenset(("PointLight", "Camera", "AreaLight"))
+
     def __init__(self, rdrname):
         self.renderer_name = str(rdrname)
 
@@ -715,6 +818,9 @@ class RendererHandler:
             App.Console.PrintError(msg)
             raise
 
+        self._method_cache = {}  # Renderer module methods, by name
+        self._legacy_object = None  # See _legacy_write_object
+
     def render(self, project, prefix, external, output, width, height):
         """Run the external renderer
 
@@ -749,10 +855,11 @@ class RendererHandler:
         get_rendering_string requirements"""
 
         try:
-            res = (obj.isDerivedFrom("Part::Feature") or
-                   obj.isDerivedFrom("Mesh::Feature") or
-                   (obj.isDerivedFrom("App::FeaturePython") and
-                    obj.Proxy.type in ["PointLight", "Camera", "AreaLight"]))
+            derived = obj.isDerivedFrom
+            res = (derived("Part::Feature") or
+                   derived("Mesh::Feature") or
+                   (derived("App::FeaturePython") and
+                    obj.Proxy.type in RendererHandler._RENDERABLE_PROXIES))
         except AttributeError:
             res = False
 
@@ -790,22 +897,10 @@ class RendererHandler:
 
         try:
             source = view.Source
+            objtype = getattr(getattr(source, "Proxy", None), "type", "Object")
+            name = source.Name
 
-            try:
-                objtype = source.Proxy.type
-            except AttributeError:
-                objtype = "Object"
-
-            name = str(source.Name)
-
-            switcher = {
-                "Object": RendererHandler._render_object,
-                "PointLight": RendererHandler._render_pointlight,
-                "Camera": RendererHandler._render_camera,
-                "AreaLight": RendererHandler._render_arealight
-                }
-
-            res = switcher[objtype](self, name, view)
+            res = RendererHandler._DISPATCH[objtype](self, name, view)
 
         except (AttributeError, TypeError, AssertionError) as err:
             msg = translate(
@@ -835,15 +930,12 @@ class RendererHandler:
         if mat:
             if "Material" in mat.PropertiesList:
                 if "DiffuseColor" in mat.Material:
-                    color = mat.Material["DiffuseColor"]\
-                               .strip("(")\
-                               .strip(")")\
-                               .split(",")[:3]
+                    match = _COLOR_RE.match(mat.Material["DiffuseColor"])
+                    if match:
+                        color = tuple(map(float, match.groups()))
                 if "Transparency" in mat.Material:
-                    if float(mat.Material["Transparency"]) > 0:
-                        alpha = 1.0 - float(mat.Material["Transparency"])
-                    else:
-                        alpha = 1.0
+                    transparency = float(mat.Material["Transparency"])
+                    alpha = 1.0 - transparency if transparency > 0 else 1.0
 
         if view.Source.ViewObject:
             vobj = view.Source.ViewObject
@@ -851,9 +943,9 @@ class RendererHandler:
                 if hasattr(vobj, "ShapeColor"):
                     color = vobj.ShapeColor[:3]
             if not alpha:
-                if hasattr(vobj, "Transparency"):
-                    if vobj.Transparency > 0:
-                        alpha = 1.0 - float(vobj.Transparency) / 100.0
+                transparency = float(getattr(vobj, "Transparency", 0))
+                if transparency > 0:
+                    alpha = 1.0 - transparency / 100.0
         if not color:
             color = (1.0, 1.0, 1.0)
         if not alpha:
@@ -861,32 +953,74 @@ class RendererHandler:
 
         # get mesh
         mesh = None
-        if hasattr(view.Source, "Group"):
-            shps = [o.Shape for o in Draft.getGroupContents(view.Source)
-                    if hasattr(o, "Shape")]
-            mesh = MeshPart.meshFromShape(Shape=Part.makeCompound(shps),
-                                          LinearDeflection=0.1,
-                                          AngularDeflection=0.523599,
-                                          Relative=False)
-        elif view.Source.isDerivedFrom("Part::Feature"):
-            mesh = MeshPart.meshFromShape(Shape=view.Source.Shape,
-                                          LinearDeflection=0.1,
-                                          AngularDeflection=0.523599,
-                                          Relative=False)
-        elif view.Source.isDerivedFrom("Mesh::Feature"):
+        source = view.Source
+        docname = getattr(getattr(source, "Document", None), "Name", None)
+        if hasattr(source, "Group"):
+            # pylint: disable=import-outside-toplevel
+            import Draft
+            import Mesh
+
+            # Tessellate (and cache) children one by one, then merge: when a
+            # child changes, only this child has to be tessellated again
+            mesh = Mesh.Mesh()
+            for obj in Draft.getGroupContents(source):
+                shape = getattr(obj, "Shape", None)
+                if shape is not None:
+                    key = (docname, obj.Name)
+                    mesh.addMesh(_mesh_from_shape(key, shape))
+        elif source.isDerivedFrom("Part::Feature"):
+            shape = source.Shape
+            # Objects outside any document (ground plane...) are transient:
+            # they are not cached
+            key = (docname, source.Name) if docname is not None else None
+            mesh = _mesh_from_shape(key, shape)
+        elif source.isDerivedFrom("Mesh::Feature"):
             mesh = view.Source.Mesh
 
         assert mesh, translate("Render", "Cannot find mesh data")
-        assert mesh.Topology[0] and mesh.Topology[1],\
+        topology = mesh.Topology  # Rebuilt on each access: bind it once
+        assert topology[0] and topology[1],\
             translate("Render", "Mesh topology is empty")
-        assert mesh.getPointNormals(),\
-            translate("Render", "Mesh topology has no normals")
+        normals = mesh.getPointNormals()
+        assert normals, translate("Render", "Mesh topology has no normals")
+
+        if self._legacy_write_object():
+            return self._call_renderer("write_object",
+                                       name, mesh, color, alpha)
+
+        # Hand geometry over to renderer as arrays, built once and for all
+        points = np.array(topology[0], dtype=float)  # (n, 3)
+        facets = np.array(topology[1], dtype=np.int32)  # (m, 3)
+        normals = np.array(normals, dtype=float)  # (n, 3)
 
         return self._call_renderer("write_object",
                                    name,
                                    mesh,
                                    color,
-                                   alpha)
+                                   alpha,
+                                   points,
+                                   facets,
+                                   normals)
+
+    def _legacy_write_object(self):
+        """Check whether renderer's write_object has the legacy signature
+
+        Former plugins implement 'write_object(name, mesh, color, alpha)'
+        and are not given the geometry arrays. The check is made once per
+        handler.
+
+        Returns: True if write_object does not accept the geometry arrays
+        """
+        if self._legacy_object is None:
+            method = self.renderer_module.write_object
+            self._legacy_object = False
+            try:
+                inspect.signature(method).bind(*[None] * 7)
+            except TypeError:
+                self._legacy_object = True
+            except ValueError:  # No signature available: assume current
+                pass
+        return self._legacy_object
 
     def _render_camera(self, name, view):
         """Provide a rendering string for a camera.
@@ -901,10 +1035,15 @@ class RendererHandler:
         """
         cam = view.Source
         a_ratio = float(cam.AspectRatio)
-        pos = App.Base.Placement(cam.Placement)
-        target = pos.Base.add(
-            pos.Rotation.multVec(App.Vector(0, 0, -1)).multiply(a_ratio))
-        updir = pos.Rotation.multVec(App.Vector(0, 1, 0))
+        pos = cam.Placement
+        # Camera looks towards its local -z and its up direction is local y,
+        # so we can read both directly in rotation matrix columns
+        mat = pos.toMatrix()
+        base = pos.Base
+        target = App.Vector(base.x - mat.A13 * a_ratio,
+                            base.y - mat.A23 * a_ratio,
+                            base.z - mat.A33 * a_ratio)
+        updir = App.Vector(mat.A12, mat.A22, mat.A32)
         return self._call_renderer("write_camera",
                                    name,
                                    pos,
@@ -923,7 +1062,7 @@ class RendererHandler:
         Returns: a rendering string, obtained from the renderer module
         """
         # get location, color
-        location = App.Base.Vector(view.Source.Location)
+        location = view.Source.Location
         color = view.Source.Color
 
         # we accept missing Power (default value: 60)...
@@ -948,7 +1087,7 @@ class RendererHandler:
         Returns: a rendering string, obtained from the renderer module
         """
         # Get properties
-        placement = App.Base.Placement(view.Source.Placement)
+        placement = view.Source.Placement
         color = view.Source.Color
         power = float(view.Source.Power)
         size_u = float(view.Source.SizeU)
@@ -973,9 +1112,31 @@ class RendererHandler:
 
         Returns: a rendering string, obtained from the renderer module
         """
-        renderer_method = getattr(self.renderer_module, method)
+        try:
+            renderer_method = self._method_cache[method]
+        except KeyError:
+            renderer_method = getattr(self.renderer_module, method)
+            self._method_cache[method] = renderer_method
         return renderer_method(*args)
 
+    # Specialized rendering methods, by object type (see get_rendering_string)
+    _DISPATCH = {
+        "Object": _render_object,
+        "PointLight": _render_pointlight,
+        "Camera": _render_camera,
+        "AreaLight": _render_arealight
+        }
+
+
+@functools.lru_cache(maxsize=8)
+def get_renderer_handler(rdrname):
+    """Get a (shared) RendererHandler for a given renderer name
+
+    Handlers are stateless beyond their renderer module, so a single instance
+    per renderer can serve all projects and views.
+    """
+    return RendererHandler(rdrname)
+
 
 # ===========================================================================
 #                               GUI Commands
@@ -1015,6 +1176,12 @@ class RenderProjectCommand:
         if not template:
             return
 
+        # Check renderer module can be loaded (error is reported by handler)
+        try:
+            get_renderer_handler(self.renderer)
+        except ModuleNotFoundError:
+            return
+
         # Create project
         Project.create(App.ActiveDocument, self.renderer, template)
 
@@ -1080,17 +1247,16 @@ class RenderCommand:
 
     def Activated(self):  # pylint: disable=no-self-use
         """Code to be executed when command is run (callback)"""
-        # Find project
-        project = None
-        sel = Gui.Selection.getSelection()
-        for obj in sel:
-            if "Renderer" in obj.PropertiesList:
-                project = obj
-                break
-        if not project:
-            for obj in App.ActiveDocument.Objects:
-                if "Renderer" in obj.PropertiesList:
-                    return
+        # Find project: first in selection, then in active document
+        candidates = itertools.chain(Gui.Selection.getSelection(),
+                                     App.ActiveDocument.Objects)
+        project = next(filter(RendererHandler.is_project, candidates), None)
+        if project is None:
+            msg = translate(
+                "Render",
+                "Unable to find a valid project in selection or document\n")
+            App.Console.PrintError(msg)
+            return
 
         # Render (and display if required)
         project.Proxy.render()
@@ -1149,11 +1315,21 @@ class AreaLightCommand:
 # ===========================================================================
 
 
-# If Gui is up, create the FreeCAD commands
-if App.GuiUp:
-    # Add commands
-    RENDER_COMMANDS = []
-    for rend in RENDERERS:
+RENDER_COMMANDS = []  # Commands names, filled by add_commands
+
+
+def add_commands():
+    """Create the FreeCAD commands of the workbench (once)
+
+    This function is to be called on workbench initialization (see
+    InitGui.py), so that merely importing this module (when a document is
+    restored, for instance) does not register any command.
+
+    Returns: the list of commands names, for toolbars and menus
+    """
+    if RENDER_COMMANDS:
+        return RENDER_COMMANDS
+    for rend in get_renderers():
         Gui.addCommand('Render_' + rend, RenderProjectCommand(rend))
         RENDER_COMMANDS.append('Render_' + rend)
     RENDER_COMMANDS.append("Separator")
@@ -1167,5 +1343,6 @@ if App.GuiUp:
                 ("Render", RenderCommand())):
         Gui.addCommand(*cmd)
         RENDER_COMMANDS.append(cmd[0])
+    return RENDER_COMMANDS
 
 # vim: foldmethod=indent
@@ -32,9 +32,10 @@ scenes"""
 from collections import namedtuple
 from types import SimpleNamespace
 from os import path
-import itertools
 import math
+import weakref
 
+import numpy as np
 from pivy import coin
 from PySide.QtGui import QAction
 from PySide.QtCore import QT_TRANSLATE_NOOP, QObject, SIGNAL
@@ -42,6 +43,17 @@ import FreeCAD as App
 import FreeCADGui as Gui
 
 
+# ===========================================================================
+#                           Constants
+# ===========================================================================
+
+
+# Tree view icons (getIcon may be called at each tree repaint)
+_ICONDIR = path.join(path.dirname(__file__), "icons")
+_ICON_POINTLIGHT = path.join(_ICONDIR, "PointLight.svg")
+_ICON_AREALIGHT = path.join(_ICONDIR, "AreaLight.svg")
+
+
 # ===========================================================================
 #                           Module functions
 # ===========================================================================
@@ -50,18 +62,15 @@ import FreeCADGui as Gui
 def make_star(subdiv=8, radius=1):
     """Creates a 3D star graph, in which every single vertex is connected
     to the center vertex and nobody else."""
-
-    def cartesian(radius, theta, phi):
-        return (radius * math.sin(theta) * math.cos(phi),
-                radius * math.sin(theta) * math.sin(phi),
-                radius * math.cos(theta))
-
-    rng_theta = [math.pi * i / subdiv for i in range(0, subdiv + 1)]
-    rng_phi = [math.pi * i / subdiv for i in range(0, 2 * subdiv)]
-    rng = itertools.product(rng_theta, rng_phi)
-    pnts = [cartesian(radius, theta, phi) for theta, phi in rng]
-    vecs = [x for y in zip(itertools.repeat((0, 0, 0)), pnts) for x in y]
-    return vecs
+    theta = np.linspace(0, math.pi, subdiv + 1)
+    phi = np.linspace(0, 2 * math.pi, 2 * subdiv, endpoint=False)
+    theta, phi = (a.ravel() for a in np.meshgrid(theta, phi, indexing="ij"))
+    rsin_theta = radius * np.sin(theta)
+    vecs = np.zeros((theta.size, 2, 3))  # (center, point) pairs
+    vecs[:, 1, 0] = rsin_theta * np.cos(phi)
+    vecs[:, 1, 1] = rsin_theta * np.sin(phi)
+    vecs[:, 1, 2] = radius * np.cos(theta)
+    return vecs.reshape(-1, 3).tolist()
 
 
 # ===========================================================================
@@ -72,29 +81,35 @@ def make_star(subdiv=8, radius=1):
 class PointLight:
     """A point light"""
 
-    Prop = namedtuple('Prop', ['Type', 'Group', 'Doc', 'Default'])
+    __slots__ = ("type",)
+
+    Prop = namedtuple('Prop', ['Name', 'Type', 'Group', 'Doc', 'Default'])
 
     # FeaturePython object properties
-    PROPERTIES = {
-        "Location": Prop(
+    PROPERTIES = (
+        Prop(
+            "Location",
             "App::PropertyVector",
             "Light",
             QT_TRANSLATE_NOOP("Render", "Location of light"),
             App.Vector(0, 0, 15)),
 
-        "Color": Prop(
+        Prop(
+            "Color",
             "App::PropertyColor",
             "Light",
             QT_TRANSLATE_NOOP("Render", "Color of light"),
             (1.0, 1.0, 1.0)),
 
-        "Power": Prop(
+        Prop(
+            "Power",
             "App::PropertyFloat",
             "Light",
             QT_TRANSLATE_NOOP("Render", "Rendering power"),
             60.0),
 
-        "Radius": Prop(
+        Prop(
+            "Radius",
             "App::PropertyLength",
             "Light",
             QT_TRANSLATE_NOOP("Render", "Light representation radius.\n"
@@ -102,7 +117,7 @@ class PointLight:
                                         "on rendering"),
             2.0),
 
-    }
+    )
     # ~FeaturePython object properties
 
     def __init__(self, fpo):
@@ -119,10 +134,13 @@ class PointLight:
     @classmethod
     def set_properties(cls, fpo):
         """Set underlying FeaturePython object's properties"""
-        for name in cls.PROPERTIES.keys() - set(fpo.PropertiesList):
-            spec = cls.PROPERTIES[name]
-            prop = fpo.addProperty(spec.Type, name, spec.Group, spec.Doc, 0)
-            setattr(prop, name, spec.Default)
+        existing = frozenset(fpo.PropertiesList)
+        missing = [p for p in cls.PROPERTIES if p.Name not in existing]
+        if not missing:
+            return  # Usual case on document restore
+        for name, typ, group, doc, default in missing:
+            prop = fpo.addProperty(typ, name, group, doc, 0)
+            setattr(prop, name, default)
 
     @staticmethod
     def create(document=None):
@@ -156,15 +174,32 @@ class PointLight:
         fpo.Proxy = self
         self.set_properties(fpo)
 
-    def execute(self, fpo):
-        # pylint: disable=no-self-use
+    @staticmethod
+    def execute(fpo):
         """Callback triggered on document recomputation (mandatory)."""
 
+    def __getstate__(self):
+        """Called while saving the document
+
+        As there is no instance __dict__ (slots), state has to be given
+        explicitly (same format as former __dict__ dump)
+        """
+        return {"type": self.type}
+
+    def __setstate__(self, state):
+        """Called while restoring document"""
+        self.type = "PointLight"
+
 
 class ViewProviderPointLight:
     """View Provider of PointLight class"""
 
+    __slots__ = ("fpo", "coin")
+
     SHAPE = make_star(radius=1)
+    _SHAPE_LEN = len(SHAPE)
+    _NUMVERTS = [2] * (_SHAPE_LEN // 2)  # Star is made of 2-vertex lines
+    _SHAPE_NODES = None  # Shared by all instances, see _shape_nodes
 
     def __init__(self, vobj):
         """Initializer
@@ -210,12 +245,8 @@ class ViewProviderPointLight:
         self.coin.drawstyle.lineWidth = 1
         self.coin.drawstyle.linePattern = 0xaaaa
         self.coin.node.addChild(self.coin.drawstyle)
-        self.coin.coords = coin.SoCoordinate3()
-        self.coin.coords.point.setValues(0, len(self.SHAPE), self.SHAPE)
+        self.coin.coords, self.coin.lineset = self._shape_nodes()
         self.coin.node.addChild(self.coin.coords)
-        self.coin.lineset = coin.SoLineSet()
-        self.coin.lineset.numVertices.setValues(
-            0, len(self.SHAPE) // 2, [2] * (len(self.SHAPE) // 2))
         self.coin.node.addChild(self.coin.lineset)
 
         self.coin.geometry.addChild(self.coin.node)
@@ -229,6 +260,25 @@ class ViewProviderPointLight:
         self._update_power(self.fpo)
         self._update_radius(self.fpo)
 
+    @classmethod
+    def _shape_nodes(cls):
+        """Get the coin nodes (coordinates and lineset) of the star shape
+
+        The nodes are created at first call and then shared by all point
+        lights (coin nodes are reference-counted), so that the shape is not
+        duplicated for each light.
+
+        Returns: a tuple (SoCoordinate3, SoLineSet)
+        """
+        if cls._SHAPE_NODES is None:
+            coords = coin.SoCoordinate3()
+            coords.point.setValues(0, cls._SHAPE_LEN, cls.SHAPE)
+            lineset = coin.SoLineSet()
+            lineset.numVertices.setValues(
+                0, len(cls._NUMVERTS), cls._NUMVERTS)
+            cls._SHAPE_NODES = (coords, lineset)
+        return cls._SHAPE_NODES
+
     def onDelete(self, feature, subelements):
         """Code executed when object is deleted (callback)"""
         # Delete coin representation
@@ -263,7 +313,7 @@ class ViewProviderPointLight:
     def getIcon(self):
         # pylint: disable=no-self-use
         """Return the icon which will appear in the tree view (callback)"""
-        return path.join(path.dirname(__file__), "icons", "PointLight.svg")
+        return _ICON_POINTLIGHT
 
     def onChanged(self, vpdo, prop):
         """Code executed when a ViewProvider's property got modified (callback)
@@ -287,25 +337,25 @@ class ViewProviderPointLight:
         fpo: related FeaturePython object
         prop: property name
         """
-        switcher = {
-            "Location": ViewProviderPointLight._update_location,
-            "Power": ViewProviderPointLight._update_power,
-            "Color": ViewProviderPointLight._update_color,
-            "Radius": ViewProviderPointLight._update_radius,
-        }
-
-        try:
-            update_method = switcher[prop]
-        except KeyError:
-            pass  # Silently ignore when switcher provides no action
-        else:
-            update_method(self, fpo)
+        # Other properties are silently ignored
+        if prop == "Location":
+            self._update_location(fpo)
+        elif prop == "Power":
+            self._update_power(fpo)
+        elif prop == "Color":
+            self._update_color(fpo)
+        elif prop == "Radius":
+            self._update_radius(fpo)
+
+    # Coin fields are set from plain floats, which spares building a tuple
+    # or a list at each update (they may occur at a high rate when dragging)
 
     def _update_location(self, fpo):
         """Update pointlight location"""
-        location = fpo.Location[:3]
-        self.coin.transform.translation.setValue(location)
-        self.coin.light.location.setValue(location)
+        location = fpo.Location
+        x, y, z = location.x, location.y, location.z
+        self.coin.transform.translation.setValue(x, y, z)
+        self.coin.light.location.setValue(x, y, z)
 
     def _update_power(self, fpo):
         """Update pointlight power"""
@@ -314,14 +364,14 @@ class ViewProviderPointLight:
 
     def _update_color(self, fpo):
         """Update pointlight color"""
-        color = fpo.Color[:3]
-        self.coin.material.diffuseColor.setValue(color)
-        self.coin.light.color.setValue(color)
+        red, green, blue, _ = fpo.Color
+        self.coin.material.diffuseColor.setValue(red, green, blue)
+        self.coin.light.color.setValue(red, green, blue)
 
     def _update_radius(self, fpo):
         """Update pointlight radius"""
-        scale = [fpo.Radius] * 3
-        self.coin.transform.scaleFactor.setValue(scale)
+        radius = float(fpo.Radius)  # Radius is a Quantity
+        self.coin.transform.scaleFactor.setValue(radius, radius, radius)
 
     def __getstate__(self):
         """Called while saving the document"""
@@ -379,7 +429,7 @@ class AreaLight:
     }
     # ~FeaturePython object properties
 
-    _fpos = dict()  # FeaturePython objects
+    _fpos = weakref.WeakKeyDictionary()  # FeaturePython objects
 
     def __init__(self, fpo):
         """AreaLight initializer
@@ -396,12 +446,12 @@ class AreaLight:
     @property
     def fpo(self):
         """Underlying FeaturePython object getter"""
-        return self._fpos[id(self)]
+        return self._fpos[self]
 
     @fpo.setter
     def fpo(self, new_fpo):
         """Underlying FeaturePython object setter"""
-        self._fpos[id(self)] = new_fpo
+        self._fpos[self] = new_fpo
 
     @classmethod
     def set_properties(cls, fpo):
@@ -577,7 +627,7 @@ class ViewProviderAreaLight:
     def getIcon(self):
         # pylint: disable=no-self-use
         """Return the icon which will appear in the tree view (callback)"""
-        return path.join(path.dirname(__file__), "icons", "AreaLight.svg")
+        return _ICON_AREALIGHT
 
     def onChanged(self, vpdo, prop):
         """Code executed when a ViewProvider's property got modified (callback)
@@ -44,7 +44,7 @@ import FreeCAD as App
 # ===========================================================================
 
 
-def write_object(name, mesh, color, alpha):
+def write_object(name, mesh, color, alpha, points, facets, normals):
     """Compute a string in the format of Appleseed, that represents a FreeCAD
     object
     """
@@ -40,7 +40,7 @@ import FreeCAD as App
 # ===========================================================================
 
 
-def write_object(name, mesh, color, alpha):
+def write_object(name, mesh, color, alpha, points, facets, normals):
     """Compute a string in the format of Cycles, that represents a FreeCAD
     object
     """
@@ -76,14 +76,14 @@ def write_object(name, mesh, color, alpha):
 
     snippet = snippet1 + (snippet2a if alpha < 1 else snippet2b) + snippet3
 
-    points = ["{0.x} {0.y} {0.z}".format(p) for p in mesh.Topology[0]]
-    verts = ["{} {} {}".format(*v) for v in mesh.Topology[1]]
+    pnts = ["{} {} {}".format(*p) for p in points.tolist()]
+    verts = ["{} {} {}".format(*v) for v in facets.tolist()]
     nverts = ["3"] * len(verts)
 
     return snippet.format(n=name,
                           c=color,
                           a=alpha,
-                          p="  ".join(points),
+                          p="  ".join(pnts),
                           i="  ".join(nverts),
                           v="  ".join(verts))
 
@@ -46,7 +46,7 @@ import FreeCAD as App
 # ===========================================================================
 
 
-def write_object(name, mesh, color, alpha):
+def write_object(name, mesh, color, alpha, points, facets, normals):
     """Compute a string in the format of Luxrender, that represents a FreeCAD
     object
     """
@@ -56,9 +56,10 @@ def write_object(name, mesh, color, alpha):
     # to write all the data needed by your object (geometry, materials, etc)
     # so make sure you include everything that is needed
 
-    points = ["{0.x} {0.y} {0.z}".format(v) for v in mesh.Topology[0]]
-    norms = ["{0.x} {0.y} {0.z}".format(n) for n in mesh.getPointNormals()]
-    tris = ["{} {} {}".format(*t) for t in mesh.Topology[1]]
+    # Arrays are flattened, as Luxrender does not group coordinates
+    pnts = map(str, points.ravel().tolist())
+    nrms = map(str, normals.ravel().tolist())
+    inds = map(str, facets.ravel().tolist())
 
     snippet = """
     # Generated by FreeCAD (http://www.freecadweb.org/)
@@ -83,9 +84,9 @@ def write_object(name, mesh, color, alpha):
     return dedent(snippet).format(name=name,
                                   colo=color,
                                   trsp=alpha if alpha < 1.0 else 1.0,
-                                  inds=" ".join(tris),
-                                  pnts=" ".join(points),
-                                  nrms=" ".join(norms))
+                                  inds=" ".join(inds),
+                                  pnts=" ".join(pnts),
+                                  nrms=" ".join(nrms))
 
 
 def write_camera(name, pos, updir, target):
@@ -29,31 +29,41 @@
 # Please note that POV-Ray coordinate system appears to be different from
 # FreeCAD's one (z and y permuted)
 # See here: https://www.povray.org/documentation/3.7.0/t2_2.html#t2_2_1_1
+# For meshes, the permutation is applied to whole array columns (see
+# stream_object), never vector by vector.
 
+import io
 import os
 import re
+import shlex
+import subprocess
+from string import Formatter
 from textwrap import dedent
 
 import FreeCAD as App
 
 
-# ===========================================================================
-#                             Write functions
-# ===========================================================================
+# Width and height render parameters
+_W_RE = re.compile(r"\+W[0-9]+")
+_H_RE = re.compile(r"\+H[0-9]+")
 
+# Environment variable assignment in prefix (ex: "FOO=bar")
+_ENV_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+# On Windows, user parameters are not tokenized (see _command)
+_POSIX = os.name != "nt"
 
-def write_object(name, mesh, color, alpha):
-    """Compute a string in the format of POV-Ray, that represents a FreeCAD
-    object
-    """
+# Number of vectors formatted at once when streaming a mesh
+_CHUNKSIZE = 16384
 
-    # This is where you write your object/view in the format of your
-    # renderer. "obj" is the real 3D object handled by this project, not
-    # the project itself. This is your only opportunity
-    # to write all the data needed by your object (geometry, materials, etc)
-    # so make sure you include everything that is needed
 
-    snippet = """
+# ===========================================================================
+#                                Templates
+# ===========================================================================
+
+# Templates are dedented once and for all, at import
+
+# Object (mesh)
+_OBJECT_TPL = dedent("""
     // Generated by FreeCAD (http://www.freecadweb.org/)
     // Declares object '{name}'
     #declare {name} = mesh2 {{
@@ -79,30 +89,13 @@ def write_object(name, mesh, color, alpha):
             }}
             finish {{StdFinish}}
         }}
-    }}  // {name}\n"""
-
-    colo = "<{},{},{}>".format(*color)
-    vrts = ["<{0.x},{0.z},{0.y}>".format(v) for v in mesh.Topology[0]]
-    nrms = ["<{0.x},{0.z},{0.y}>".format(n) for n in mesh.getPointNormals()]
-    inds = ["<{},{},{}>".format(*i) for i in mesh.Topology[1]]
-
-    return dedent(snippet).format(name=name,
-                                  len_vertices=len(vrts),
-                                  vertices="\n        ".join(vrts),
-                                  len_normals=len(nrms),
-                                  normals="\n        ".join(nrms),
-                                  len_indices=len(inds),
-                                  indices="\n        ".join(inds),
-                                  color=colo)
-
-
-def write_camera(name, pos, updir, target):
-    """Compute a string in the format of POV-Ray, that represents a camera"""
-
-    # This is where you create a piece of text in the format of
-    # your renderer, that represents the camera.
+    }}  // {name}\n""")
+_OBJECT_PARTS = tuple((literal, field)
+                      for literal, field, _, _
+                      in Formatter().parse(_OBJECT_TPL))
 
-    snippet = """
+# Camera
+_CAMERA_TPL = dedent("""
     // Generated by FreeCAD (http://www.freecadweb.org/)
     // Declares camera '{n}'
     #declare cam_location = <{p.x},{p.z},{p.y}>;
@@ -115,9 +108,77 @@ def write_camera(name, pos, updir, target):
         sky       cam_sky
         angle     cam_angle
         right     x*800/600
-    }}\n"""
+    }}\n""")
+
+# Area light
+_AREALIGHT_TPL = dedent("""
+    // Generated by FreeCAD (http://www.freecadweb.org/)
+    // Declares area light {n}
+    light_source {{
+        <{o.x},{o.z},{o.y}>
+        color rgb <{c[0]},{c[1]},{c[2]}>
+        area_light <{u.x},{u.z},{u.y}>, <{v.x},{v.z},{v.y}>, {a}, {b}
+        adaptive 1
+        jitter
+    }}\n""")
+
+
+# ===========================================================================
+#                             Write functions
+# ===========================================================================
+
+
+def write_object(name, mesh, color, alpha, points, facets, normals):
+    """Compute a string in the format of POV-Ray, that represents a FreeCAD
+    object
+    """
+
+    # This is where you write your object/view in the format of your
+    # renderer. "obj" is the real 3D object handled by this project, not
+    # the project itself. This is your only opportunity
+    # to write all the data needed by your object (geometry, materials, etc)
+    # so make sure you include everything that is needed
+
+    with io.StringIO() as out:
+        stream_object(out, name, mesh, color, alpha, points, facets, normals)
+        return out.getvalue()
+
+
+def stream_object(out, name, mesh, color, alpha, points, facets, normals):
+    """Write a FreeCAD object in the format of POV-Ray into a file-like object
+
+    Geometry is written by chunks, so that large meshes never have to be
+    held in memory as one single string.
+
+    Parameters:
+    out: a writable text file-like object
+    (other parameters: see write_object)
+    """
+    # y and z are swapped for vectors (see note at top of module)
+    arrays = {"vertices": ("<%r,%r,%r>", points, (0, 2, 1)),
+              "normals": ("<%r,%r,%r>", normals, (0, 2, 1)),
+              "indices": ("<%d,%d,%d>", facets, (0, 1, 2))}
+    values = {"name": name,
+              "len_vertices": len(points),
+              "len_normals": len(normals),
+              "len_indices": len(facets),
+              "color": f"<{color[0]},{color[1]},{color[2]}>"}
+
+    for literal, field in _OBJECT_PARTS:
+        out.write(literal)
+        if field in arrays:
+            _write_array(out, *arrays[field])
+        elif field is not None:
+            out.write(str(values[field]))
+
+
+def write_camera(name, pos, updir, target):
+    """Compute a string in the format of POV-Ray, that represents a camera"""
+
+    # This is where you create a piece of text in the format of
+    # your renderer, that represents the camera.
 
-    return dedent(snippet).format(n=name, p=pos.Base, t=target, u=updir)
+    return _CAMERA_TPL.format(n=name, p=pos.Base, t=target, u=updir)
 
 
 def write_pointlight(name, pos, color, power):
@@ -129,15 +190,14 @@ def write_pointlight(name, pos, color, power):
 
     # Note: power is of no use for POV-Ray, as light intensity is determined
     # by RGB (see POV-Ray documentation)
-    snippet = """
-    // Generated by FreeCAD (http://www.freecadweb.org/)
-    // Declares point light {0}
-    light_source {{
-        <{1.x},{1.z},{1.y}>
-        color rgb<{2[0]},{2[1]},{2[2]}>
-    }}\n"""
 
-    return dedent(snippet).format(name, pos, color)
+    # Template is tiny: an f-string is cheaper than dedent/format here
+    return ("\n// Generated by FreeCAD (http://www.freecadweb.org/)\n"
+            f"// Declares point light {name}\n"
+            "light_source {\n"
+            f"    <{pos.x},{pos.z},{pos.y}>\n"
+            f"    color rgb<{color[0]},{color[1]},{color[2]}>\n"
+            "}\n")
 
 
 def write_arealight(name, pos, size_u, size_v, color, power):
@@ -154,24 +214,107 @@ def write_arealight(name, pos, size_u, size_v, color, power):
     axis1 = rot.multVec(App.Vector(size_u, 0.0, 0.0))
     axis2 = rot.multVec(App.Vector(0.0, size_v, 0.0))
 
-    snippet = """
-    // Generated by FreeCAD (http://www.freecadweb.org/)
-    // Declares area light {n}
-    light_source {{
-        <{o.x},{o.z},{o.y}>
-        color rgb <{c[0]},{c[1]},{c[2]}>
-        area_light <{u.x},{u.z},{u.y}>, <{v.x},{v.z},{v.y}>, {a}, {b}
-        adaptive 1
-        jitter
-    }}\n"""
+    return _AREALIGHT_TPL.format(n=name,
+                                 o=pos.Base,
+                                 c=color,
+                                 u=axis1,
+                                 v=axis2,
+                                 a=size_1,
+                                 b=size_2)
 
-    return dedent(snippet).format(n=name,
-                                  o=pos.Base,
-                                  c=color,
-                                  u=axis1,
-                                  v=axis2,
-                                  a=size_1,
-                                  b=size_2)
+
+# ===========================================================================
+#                              Helpers
+# ===========================================================================
+
+
+def _format_array(fmt, array):
+    """Format a (n, 3) array into a POV-Ray list of vectors
+
+    The whole array is formatted in one single '%' operation, which is much
+    faster than formatting vectors one by one.
+
+    Parameters:
+    fmt: format for one vector (ex: "<%r,%r,%r>")
+    array: the array to format
+
+    Returns: the formatted vectors, one per line
+    """
+    sep = "\n        "
+    return sep.join([fmt] * len(array)) % tuple(array.ravel().tolist())
+
+
+def _write_array(out, fmt, array, columns):
+    """Write a (n, 3) array as a POV-Ray list of vectors, chunk by chunk
+
+    Columns are reordered chunk by chunk too, so that no full-size copy of
+    the array is ever made.
+
+    Parameters:
+    out: a writable text file-like object
+    fmt: format for one vector (ex: "<%r,%r,%r>")
+    array: the array to write
+    columns: the order in which array columns are to be written
+    """
+    sep = ""
+    for start in range(0, len(array), _CHUNKSIZE):
+        out.write(sep)
+        chunk = array[start:start + _CHUNKSIZE, columns]
+        out.write(_format_array(fmt, chunk))
+        sep = "\n        "
+
+
+def _split_prefix(prefix):
+    """Split a command prefix into environment variables and arguments
+
+    As the renderer is not run through a shell, leading 'NAME=value' tokens
+    of the prefix are turned into environment variables.
+
+    Parameters:
+    prefix: the prefix string (ex: "FOO=bar optirun")
+
+    Returns: a tuple (environment, arguments list), where environment is
+    None if the prefix sets no variable
+    """
+    args = shlex.split(prefix)
+    env = None
+    while args and _ENV_RE.match(args[0]):
+        if env is None:
+            env = dict(os.environ)
+        name, value = args.pop(0).split("=", 1)
+        env[name] = value
+    return env, args
+
+
+def _command(prefix, rpath, args, files):
+    """Build the command to run the renderer
+
+    Paths (executable, files) are passed as single arguments, as they may
+    contain spaces.
+    On POSIX systems, prefix and parameters are split like a shell would do.
+    On Windows, non-POSIX splitting would break quoted arguments, so user
+    text (prefix and parameters) is kept as is in a single command line,
+    only paths being quoted.
+
+    Parameters:
+    prefix: the prefix string
+    rpath: the path to renderer executable
+    args: the renderer parameters string
+    files: the output and input files arguments
+
+    Returns: a tuple (environment, command), where environment is None if
+    the prefix sets no variable, and command is either an arguments list
+    (POSIX) or a command line string (Windows)
+    """
+    if _POSIX:
+        env, cmd = _split_prefix(prefix)
+        return env, cmd + [rpath] + shlex.split(args) + files
+
+    parts = (prefix,
+             subprocess.list2cmdline([rpath]),
+             args,
+             subprocess.list2cmdline(files))
+    return None, " ".join(p.strip() for p in parts if p.strip())
 
 
 # ===========================================================================
@@ -200,8 +343,6 @@ def render(project, prefix, external, output, width, height):
     params = App.ParamGet("User parameter:BaseApp/Preferences/Mod/Render")
 
     prefix = params.GetString("Prefix", "")
-    if prefix:
-        prefix += " "
 
     rpath = params.GetString("PovRayPath", "")
     if not rpath:
@@ -211,21 +352,24 @@ def render(project, prefix, external, output, width, height):
         return ""
 
     args = params.GetString("PovRayParameters", "")
-    if args:
-        args += " "
     if "+W" in args:
-        args = re.sub(r"\+W[0-9]+", "+W{}".format(width), args)
+        args = _W_RE.sub("+W%d" % width, args)
     else:
-        args = args + "+W{} ".format(width)
+        args += " +W%d" % width
     if "+H" in args:
-        args = re.sub(r"\+H[0-9]+", "+H{}".format(height), args)
+        args = _H_RE.sub("+H%d" % height, args)
     else:
-        args = args + "+H{} ".format(height)
-    if output:
-        args = args + "+O{} ".format(output)
-
-    cmd = prefix + rpath + " " + args + project.PageResult
-    App.Console.PrintMessage("Renderer command: %s\n" % cmd)
-    os.system(cmd)
+        args += " +H%d" % height
+
+    files = ["+O" + output] if output else []
+    files.append(project.PageResult)
+    env, cmd = _command(prefix, rpath, args, files)
+    App.Console.PrintMessage("Renderer command: %s\n" %
+                             (cmd if isinstance(cmd, str) else " ".join(cmd)))
+    try:
+        subprocess.run(cmd, env=env, check=False)
+    except OSError as err:
+        App.Console.PrintError("Unable to run renderer: %s\n" % err)
+        return ""
 
     return output if output else os.path.splitext(project.PageResult)[0]+".png"